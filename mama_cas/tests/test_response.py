@@ -27,7 +27,7 @@ class ValidationResponseTests(TestCase):
         """
         resp = ValidationResponse(context={'ticket': self.st, 'error': None},
                                   content_type='text/xml')
-        self.assertEqual(resp.get('Content-Type'), 'text/xml')
+        self.assertEqual(resp['Content-Type'], 'text/xml')
 
     def test_validation_response_ticket(self):
         """
@@ -143,7 +143,7 @@ class ProxyResponseTests(TestCase):
         """
         resp = ProxyResponse(context={'ticket': self.pt, 'error': None},
                              content_type='text/xml')
-        self.assertEqual(resp.get('Content-Type'), 'text/xml')
+        self.assertEqual(resp['Content-Type'], 'text/xml')
 
     def test_proxy_response_ticket(self):
         """
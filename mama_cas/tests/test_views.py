@@ -27,20 +27,25 @@ from mama_cas.views import SamlValidateView
 class LoginViewTests(TestCase):
     user_info = {'username': 'ellen',
                  'password': 'mamas&papas'}
-    warn_info = {'username': 'ellen',
-                 'password': 'mamas&papas',
-                 'warn': 'on'}
+    warn_info = dict(user_info, warn='on')
     service_url = 'http://www.example.com/'
 
-    def setUp(self):
-        self.user = UserFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(LoginViewTests, cls).setUpClass()
+        cls.login_url = reverse('cas_login')
+        cls.warn_url = reverse('cas_warn')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
 
     def test_login_view(self):
         """
         When called with no parameters, a ``GET`` request to the view
         should display the correct template with a login form.
         """
-        response = self.client.get(reverse('cas_login'))
+        response = self.client.get(self.login_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'mama_cas/login.html')
         self.assertTrue(isinstance(response.context['form'], LoginForm))
@@ -50,7 +55,7 @@ class LoginViewTests(TestCase):
         A response from the view should contain the correct cache-
         control header.
         """
-        response = self.client.get(reverse('cas_login'))
+        response = self.client.get(self.login_url)
         self.assertTrue('Cache-Control' in response)
         self.assertTrue('max-age=0' in response['Cache-Control'])
 
@@ -60,9 +65,9 @@ class LoginViewTests(TestCase):
         a ``POST`` request to the view should authenticate and login
         the user, and redirect to the correct view.
         """
-        response = self.client.post(reverse('cas_login'), self.user_info)
+        response = self.client.post(self.login_url, self.user_info)
         self.assertEqual(int(self.client.session['_auth_user_id']), self.user.pk)
-        self.assertRedirects(response, reverse('cas_login'))
+        self.assertRedirects(response, self.login_url)
 
     def test_login_view_login_service(self):
         """
@@ -71,13 +76,12 @@ class LoginViewTests(TestCase):
         ``ServiceTicket`` and redirect to the supplied service URL
         with the ticket included.
         """
-        response = self.client.post(reverse('cas_login'), self.user_info)
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url})
+        response = self.client.post(self.login_url, self.user_info)
+        response = self.client.get(self.login_url, {'service': self.service_url})
         self.assertEqual(ServiceTicket.objects.count(), 1)
         st = ServiceTicket.objects.latest('id')
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response['Location'].startswith(self.service_url))
-        self.assertTrue(st.ticket in response['Location'])
+        self.assertRedirects(response, '%s?ticket=%s' % (self.service_url, st.ticket),
+                             fetch_redirect_response=False)
 
     @override_settings(MAMA_CAS_VALID_SERVICES=('http://[^\.]+\.example\.org',))
     def test_login_view_invalid_service(self):
@@ -85,7 +89,7 @@ class LoginViewTests(TestCase):
         When called with an invalid service URL, the view should
         return a 403 Forbidden response.
         """
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url, 'gateway': 'true'})
+        response = self.client.get(self.login_url, {'service': self.service_url, 'gateway': 'true'})
         self.assertEqual(response.status_code, 403)
 
     def test_login_view_login_post(self):
@@ -95,22 +99,21 @@ class LoginViewTests(TestCase):
         user, create a ``ServiceTicket`` and redirect to the supplied
         service URL with the ticket included.
         """
-        url = reverse('cas_login') + "?service=%s" % self.service_url
+        url = build_url('cas_login', service=self.service_url)
         response = self.client.post(url, self.user_info)
         self.assertEqual(int(self.client.session['_auth_user_id']), self.user.pk)
         self.assertEqual(ServiceTicket.objects.count(), 1)
         st = ServiceTicket.objects.latest('id')
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response['Location'].startswith(self.service_url))
-        self.assertTrue(st.ticket in response['Location'])
+        self.assertRedirects(response, '%s?ticket=%s' % (self.service_url, st.ticket),
+                             fetch_redirect_response=False)
 
     def test_login_view_renew(self):
         """
         When called with a logged in user, a ``GET`` request to the
         view with the ``renew`` parameter should display the login page.
         """
-        response = self.client.post(reverse('cas_login'), self.user_info)
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url, 'renew': 'true'})
+        response = self.client.post(self.login_url, self.user_info)
+        response = self.client.get(self.login_url, {'service': self.service_url, 'renew': 'true'})
         self.assertTemplateUsed(response, 'mama_cas/login.html')
 
     def test_login_view_gateway(self):
@@ -119,9 +122,8 @@ class LoginViewTests(TestCase):
         view with the ``gateway`` and ``service`` parameters set
         should simply redirect the user to the supplied service URL.
         """
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url, 'gateway': 'true'})
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response['Location'], self.service_url)
+        response = self.client.get(self.login_url, {'service': self.service_url, 'gateway': 'true'})
+        self.assertRedirects(response, self.service_url, fetch_redirect_response=False)
 
     def test_login_view_gateway_auth(self):
         """
@@ -130,13 +132,12 @@ class LoginViewTests(TestCase):
         should create a ``ServiceTicket`` and redirect to the supplied
         service URL with the ticket included.
         """
-        response = self.client.post(reverse('cas_login'), self.user_info)
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url, 'gateway': 'true'})
+        response = self.client.post(self.login_url, self.user_info)
+        response = self.client.get(self.login_url, {'service': self.service_url, 'gateway': 'true'})
         self.assertEqual(ServiceTicket.objects.count(), 1)
         st = ServiceTicket.objects.latest('id')
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response['Location'].startswith(self.service_url))
-        self.assertTrue(st.ticket in response['Location'])
+        self.assertRedirects(response, '%s?ticket=%s' % (self.service_url, st.ticket),
+                             fetch_redirect_response=False)
 
     @override_settings(MAMA_CAS_ALLOW_AUTH_WARN=True)
     def test_login_view_warn_session(self):
@@ -144,7 +145,7 @@ class LoginViewTests(TestCase):
         When a user logs in with the warn parameter present, the user's
         session should contain a ``warn`` attribute.
         """
-        self.client.post(reverse('cas_login'), self.warn_info)
+        self.client.post(self.login_url, self.warn_info)
         self.assertEqual(self.client.session.get('warn'), True)
 
     @override_settings(MAMA_CAS_ALLOW_AUTH_WARN=True)
@@ -154,9 +155,9 @@ class LoginViewTests(TestCase):
         ``warn`` attribute is set, it should redirect to the warn view
         with the appropriate parameters.
         """
-        self.client.post(reverse('cas_login'), self.warn_info)
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url})
-        self.assertTrue(reverse('cas_warn') in response['Location'])
+        self.client.post(self.login_url, self.warn_info)
+        response = self.client.get(self.login_url, {'service': self.service_url})
+        self.assertTrue(self.warn_url in response['Location'])
         self.assertTrue("service=" in response['Location'])
         self.assertTrue('ticket=ST-' in response['Location'])
 
@@ -167,9 +168,9 @@ class LoginViewTests(TestCase):
         gateway parameter and the ``warn`` attribute is set, it should
         redirect to the warn view with the appropriate parameters.
         """
-        self.client.post(reverse('cas_login'), self.warn_info)
-        response = self.client.get(reverse('cas_login'), {'service': self.service_url, 'gateway': 'true'})
-        self.assertTrue(reverse('cas_warn') in response['Location'])
+        self.client.post(self.login_url, self.warn_info)
+        response = self.client.get(self.login_url, {'service': self.service_url, 'gateway': 'true'})
+        self.assertTrue(self.warn_url in response['Location'])
         self.assertTrue("service=" in response['Location'])
         self.assertTrue('ticket=ST-' in response['Location'])
 
@@ -180,8 +181,15 @@ class WarnViewTests(TestCase):
                  'password': 'mamas&papas'}
     url = 'http://www.example.com'
 
-    def setUp(self):
-        self.user = UserFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(WarnViewTests, cls).setUpClass()
+        cls.warn_url = reverse('cas_warn')
+        cls.login_url = reverse('cas_login')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
 
     def test_warn_view_display(self):
         """
@@ -192,7 +200,7 @@ class WarnViewTests(TestCase):
         self.client.login(username=self.user_info['username'],
                           password=self.user_info['password'])
         st = ServiceTicketFactory()
-        response = self.client.get(reverse('cas_warn'), {'service': self.url, 'ticket': st.ticket})
+        response = self.client.get(self.warn_url, {'service': self.url, 'ticket': st.ticket})
         self.assertContains(response, self.url, count=3)
         self.assertContains(response, st.ticket)
         self.assertTemplateUsed(response, 'mama_cas/warn.html')
@@ -202,8 +210,8 @@ class WarnViewTests(TestCase):
         When a user is not logged in, a request to the view should
         redirect to the login view.
         """
-        response = self.client.get(reverse('cas_warn'))
-        self.assertRedirects(response, reverse('cas_login'))
+        response = self.client.get(self.warn_url)
+        self.assertRedirects(response, self.login_url)
 
     @override_settings(MAMA_CAS_VALID_SERVICES=('[^\.]+\.example\.org',))
     def test_warn_view_invalid_service(self):
@@ -213,8 +221,8 @@ class WarnViewTests(TestCase):
         """
         self.client.login(username=self.user_info['username'],
                           password=self.user_info['password'])
-        response = self.client.get(reverse('cas_warn'), {'service': self.url})
-        self.assertRedirects(response, reverse('cas_login'))
+        response = self.client.get(self.warn_url, {'service': self.url})
+        self.assertRedirects(response, self.login_url)
 
 
 @override_settings(MAMA_CAS_VALID_SERVICES=('[^\.]+\.example\.com',))
@@ -225,16 +233,23 @@ class LogoutViewTests(TestCase):
                  'email': 'ellen@example.com'}
     url = 'http://www.example.com'
 
-    def setUp(self):
-        self.user = UserFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(LogoutViewTests, cls).setUpClass()
+        cls.logout_url = reverse('cas_logout')
+        cls.login_url = reverse('cas_login')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
 
     def test_logout_view(self):
         """
         When called with no parameters and no logged in user, a ``GET``
         request to the view should simply redirect to the login view.
         """
-        response = self.client.get(reverse('cas_logout'))
-        self.assertRedirects(response, reverse('cas_login'))
+        response = self.client.get(self.logout_url)
+        self.assertRedirects(response, self.login_url)
         self.assertTrue('Cache-Control' in response)
         self.assertTrue('max-age=0' in response['Cache-Control'])
 
@@ -243,9 +258,10 @@ class LogoutViewTests(TestCase):
         When called with a logged in user, a ``GET`` request to the
         view should log the user out and display the correct template.
         """
-        response = self.client.post(reverse('cas_login'), self.user_info)
-        response = self.client.get(reverse('cas_logout'))
-        self.assertRedirects(response, reverse('cas_login'))
+        self.client.login(username=self.user_info['username'],
+                          password=self.user_info['password'])
+        response = self.client.get(self.logout_url)
+        self.assertRedirects(response, self.login_url)
         self.assertFalse('_auth_user_id' in self.client.session)
 
     @override_settings(MAMA_CAS_FOLLOW_LOGOUT_URL=True)
@@ -255,10 +271,10 @@ class LogoutViewTests(TestCase):
         is set to ``True``, a ``GET`` request containing ``service``
         should log the user out and redirect to the supplied URL.
         """
-        response = self.client.post(reverse('cas_login'), self.user_info)
-        response = self.client.get(reverse('cas_logout'), {'service': self.url})
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response['Location'], self.url)
+        self.client.login(username=self.user_info['username'],
+                          password=self.user_info['password'])
+        response = self.client.get(self.logout_url, {'service': self.url})
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
         self.assertFalse('_auth_user_id' in self.client.session)
 
     @override_settings(MAMA_CAS_ENABLE_SINGLE_SIGN_OUT=True)
@@ -270,9 +286,10 @@ class LogoutViewTests(TestCase):
         """
         ConsumedServiceTicketFactory()
         ConsumedServiceTicketFactory()
-        self.client.post(reverse('cas_login'), self.user_info)
+        self.client.login(username=self.user_info['username'],
+                          password=self.user_info['password'])
         with patch('requests.post') as mock:
-            self.client.get(reverse('cas_logout'))
+            self.client.get(self.logout_url)
             self.assertEqual(mock.call_count, 2)
 
 
@@ -280,19 +297,25 @@ class ValidateViewTests(TestCase):
     url = 'http://www.example.com/'
     url2 = 'http://www.example.org/'
 
-    def setUp(self):
-        self.st = ServiceTicketFactory()
-        self.rf = RequestFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(ValidateViewTests, cls).setUpClass()
+        cls.validate_url = reverse('cas_validate')
+        cls.rf = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.st = ServiceTicketFactory()
 
     def test_validate_view(self):
         """
         When called with no parameters, a validation failure should
         be returned.
         """
-        request = self.rf.get(reverse('cas_validate'))
+        request = self.rf.get(self.validate_url)
         response = ValidateView.as_view()(request)
         self.assertContains(response, "no\n\n")
-        self.assertEqual(response.get('Content-Type'), 'text/plain')
+        self.assertEqual(response['Content-Type'], 'text/plain')
 
     @override_settings(MAMA_CAS_VALID_SERVICES=('[^\.]+\.example\.com',))
     def test_validate_view_invalid_service(self):
@@ -300,10 +323,10 @@ class ValidateViewTests(TestCase):
         When called with an invalid service identifier, a validation
         failure should be returned.
         """
-        request = self.rf.get(reverse('cas_validate'), {'service': self.url2, 'ticket': self.st.ticket})
+        request = self.rf.get(self.validate_url, {'service': self.url2, 'ticket': self.st.ticket})
         response = ValidateView.as_view()(request)
         self.assertContains(response, "no\n\n")
-        self.assertEqual(response.get('Content-Type'), 'text/plain')
+        self.assertEqual(response['Content-Type'], 'text/plain')
 
     def test_validate_view_invalid_ticket(self):
         """
@@ -311,20 +334,20 @@ class ValidateViewTests(TestCase):
         should be returned.
         """
         st_str = ServiceTicket.objects.create_ticket_str()
-        request = self.rf.get(reverse('cas_validate'), {'service': self.url, 'ticket': st_str})
+        request = self.rf.get(self.validate_url, {'service': self.url, 'ticket': st_str})
         response = ValidateView.as_view()(request)
         self.assertContains(response, "no\n\n")
-        self.assertEqual(response.get('Content-Type'), 'text/plain')
+        self.assertEqual(response['Content-Type'], 'text/plain')
 
     def test_validate_view_success(self):
         """
         When called with valid parameters, a validation success should
         be returned. The provided ticket should then be consumed.
         """
-        request = self.rf.get(reverse('cas_validate'), {'service': self.url, 'ticket': self.st.ticket})
+        request = self.rf.get(self.validate_url, {'service': self.url, 'ticket': self.st.ticket})
         response = ValidateView.as_view()(request)
         self.assertContains(response, "yes\nellen\n")
-        self.assertEqual(response.get('Content-Type'), 'text/plain')
+        self.assertEqual(response['Content-Type'], 'text/plain')
 
         st = ServiceTicket.objects.get(ticket=self.st.ticket)
         self.assertTrue(st.is_consumed())
@@ -334,27 +357,33 @@ class ServiceValidateViewTests(TestCase):
     url = 'http://www.example.com/'
     url2 = 'https://www.example.org/'
 
-    def setUp(self):
-        self.st = ServiceTicketFactory()
-        self.rf = RequestFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(ServiceValidateViewTests, cls).setUpClass()
+        cls.service_validate_url = reverse('cas_service_validate')
+        cls.rf = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.st = ServiceTicketFactory()
 
     def test_service_validate_view(self):
         """
         When called with no parameters, a validation failure should
         be returned.
         """
-        request = self.rf.get(reverse('cas_service_validate'))
+        request = self.rf.get(self.service_validate_url)
         response = ServiceValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_REQUEST')
+        self.assertContains(response, 'code="INVALID_REQUEST"')
 
     def test_service_validate_view_invalid_service(self):
         """
         When called with an invalid service identifier, a validation
         failure should be returned.
         """
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url2, 'ticket': self.st.ticket})
+        request = self.rf.get(self.service_validate_url, {'service': self.url2, 'ticket': self.st.ticket})
         response = ServiceValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_SERVICE')
+        self.assertContains(response, 'code="INVALID_SERVICE"')
 
     def test_service_validate_view_invalid_ticket(self):
         """
@@ -362,9 +391,9 @@ class ServiceValidateViewTests(TestCase):
         should be returned.
         """
         st_str = ServiceTicket.objects.create_ticket_str()
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url, 'ticket': st_str})
+        request = self.rf.get(self.service_validate_url, {'service': self.url, 'ticket': st_str})
         response = ServiceValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_TICKET')
+        self.assertContains(response, 'code="INVALID_TICKET"')
 
     def test_service_validate_view_proxy_ticket(self):
         """
@@ -372,9 +401,9 @@ class ServiceValidateViewTests(TestCase):
         indicate that it was because a proxy ticket was provided.
         """
         pt_str = ProxyTicket.objects.create_ticket_str()
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url, 'ticket': pt_str})
+        request = self.rf.get(self.service_validate_url, {'service': self.url, 'ticket': pt_str})
         response = ServiceValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_TICKET')
+        self.assertContains(response, 'code="INVALID_TICKET_SPEC"')
         self.assertContains(response, 'Proxy tickets cannot be validated'
                                       ' with /serviceValidate')
 
@@ -383,10 +412,10 @@ class ServiceValidateViewTests(TestCase):
         When called with valid parameters, a validation success should
         be returned. The provided ticket should then be consumed.
         """
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url, 'ticket': self.st.ticket})
+        request = self.rf.get(self.service_validate_url, {'service': self.url, 'ticket': self.st.ticket})
         response = ServiceValidateView.as_view()(request)
         self.assertContains(response, 'authenticationSuccess')
-        self.assertEqual(response.get('Content-Type'), 'text/xml')
+        self.assertEqual(response['Content-Type'], 'text/xml')
 
         st = ServiceTicket.objects.get(ticket=self.st.ticket)
         self.assertTrue(st.is_consumed())
@@ -396,9 +425,9 @@ class ServiceValidateViewTests(TestCase):
         When called with valid parameters and a ``pgtUrl``, the
         validation success should include a ``ProxyGrantingTicket``.
         """
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url,
-                                                                'ticket': self.st.ticket,
-                                                                'pgtUrl': self.url2})
+        request = self.rf.get(self.service_validate_url, {'service': self.url,
+                                                          'ticket': self.st.ticket,
+                                                          'pgtUrl': self.url2})
         with patch('requests.get') as mock:
             mock.return_value.status_code = 200
             response = ServiceValidateView.as_view()(request)
@@ -410,9 +439,9 @@ class ServiceValidateViewTests(TestCase):
         When called with valid parameters and an invalid ``pgtUrl``,
         the validation success should have no ``ProxyGrantingTicket``.
         """
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url,
-                                                                'ticket': self.st.ticket,
-                                                                'pgtUrl': self.url})
+        request = self.rf.get(self.service_validate_url, {'service': self.url,
+                                                          'ticket': self.st.ticket,
+                                                          'pgtUrl': self.url})
         response = ServiceValidateView.as_view()(request)
         self.assertContains(response, 'authenticationSuccess')
         self.assertNotContains(response, 'proxyGrantingTicket')
@@ -423,9 +452,9 @@ class ServiceValidateViewTests(TestCase):
         When ``MAMA_CAS_VALID_SERVICES`` is defined, a validation
         failure should be returned if the service URL does not match.
         """
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url, 'ticket': self.st.ticket})
+        request = self.rf.get(self.service_validate_url, {'service': self.url, 'ticket': self.st.ticket})
         response = ServiceValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_SERVICE')
+        self.assertContains(response, 'code="INVALID_SERVICE"')
 
     @override_settings(MAMA_CAS_ATTRIBUTE_CALLBACKS=('mama_cas.callbacks.user_name_attributes',))
     def test_service_validate_view_attribute_callbacks(self):
@@ -433,7 +462,7 @@ class ServiceValidateViewTests(TestCase):
         When a custom callback is defined, a validation success should
         include the returned attributes.
         """
-        request = self.rf.get(reverse('cas_service_validate'), {'service': self.url, 'ticket': self.st.ticket})
+        request = self.rf.get(self.service_validate_url, {'service': self.url, 'ticket': self.st.ticket})
         response = ServiceValidateView.as_view()(request)
         self.assertContains(response, 'attributes')
         self.assertContains(response, '<cas:username>ellen</cas:username>')
@@ -443,29 +472,35 @@ class ProxyValidateViewTests(TestCase):
     url = 'http://www.example.com/'
     url2 = 'https://www.example.com/'
 
-    def setUp(self):
-        self.st = ServiceTicketFactory()
-        self.pgt = ProxyGrantingTicketFactory()
-        self.pt = ProxyTicketFactory()
-        self.rf = RequestFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(ProxyValidateViewTests, cls).setUpClass()
+        cls.proxy_validate_url = reverse('cas_proxy_validate')
+        cls.rf = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.st = ServiceTicketFactory()
+        cls.pgt = ProxyGrantingTicketFactory(granted_by_st=cls.st)
+        cls.pt = ProxyTicketFactory(granted_by_pgt=cls.pgt)
 
     def test_proxy_validate_view(self):
         """
         When called with no parameters, a validation failure should
         be returned.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'))
+        request = self.rf.get(self.proxy_validate_url)
         response = ProxyValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_REQUEST')
+        self.assertContains(response, 'code="INVALID_REQUEST"')
 
     def test_proxy_validate_view_invalid_service(self):
         """
         When called with an invalid service identifier, a validation
         failure should be returned.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url2, 'ticket': self.pt.ticket})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url2, 'ticket': self.pt.ticket})
         response = ProxyValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_SERVICE')
+        self.assertContains(response, 'code="INVALID_SERVICE"')
 
     def test_proxy_validate_view_invalid_ticket(self):
         """
@@ -473,9 +508,9 @@ class ProxyValidateViewTests(TestCase):
         failure should be returned.
         """
         pt_str = ProxyTicket.objects.create_ticket_str()
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url, 'ticket': pt_str})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url, 'ticket': pt_str})
         response = ProxyValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_TICKET')
+        self.assertContains(response, 'code="INVALID_TICKET"')
 
     def test_proxy_validate_view_st_success(self):
         """
@@ -483,10 +518,10 @@ class ProxyValidateViewTests(TestCase):
         success should be returned. The provided ticket should be
         consumed.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url, 'ticket': self.st.ticket})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url, 'ticket': self.st.ticket})
         response = ProxyValidateView.as_view()(request)
         self.assertContains(response, 'authenticationSuccess')
-        self.assertEqual(response.get('Content-Type'), 'text/xml')
+        self.assertEqual(response['Content-Type'], 'text/xml')
 
         st = ServiceTicket.objects.get(ticket=self.st.ticket)
         self.assertTrue(st.is_consumed())
@@ -496,10 +531,10 @@ class ProxyValidateViewTests(TestCase):
         When called with a valid ``ProxyTicket``, a validation success
         should be returned. The provided ticket should be consumed.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url, 'ticket': self.pt.ticket})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url, 'ticket': self.pt.ticket})
         response = ProxyValidateView.as_view()(request)
         self.assertContains(response, 'authenticationSuccess')
-        self.assertEqual(response.get('Content-Type'), 'text/xml')
+        self.assertEqual(response['Content-Type'], 'text/xml')
 
         pt = ProxyTicket.objects.get(ticket=self.pt.ticket)
         self.assertTrue(pt.is_consumed())
@@ -513,7 +548,7 @@ class ProxyValidateViewTests(TestCase):
                                           granted_by_st=None)
         pt2 = ProxyTicketFactory(service='http://ww2.example.com',
                                  granted_by_pgt=pgt2)
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': pt2.service, 'ticket': pt2.ticket})
+        request = self.rf.get(self.proxy_validate_url, {'service': pt2.service, 'ticket': pt2.ticket})
         response = ProxyValidateView.as_view()(request)
         self.assertContains(response, 'authenticationSuccess')
         self.assertContains(response, 'http://ww2.example.com')
@@ -524,9 +559,9 @@ class ProxyValidateViewTests(TestCase):
         When called with valid parameters and a ``pgtUrl``, a
         validation success should include a ``ProxyGrantingTicket``.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url,
-                                                              'ticket': self.pt.ticket,
-                                                              'pgtUrl': self.url2})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url,
+                                                        'ticket': self.pt.ticket,
+                                                        'pgtUrl': self.url2})
         with patch('requests.get') as mock:
             mock.return_value.status_code = 200
             response = ProxyValidateView.as_view()(request)
@@ -538,9 +573,9 @@ class ProxyValidateViewTests(TestCase):
         When called with valid parameters and an invalid ``pgtUrl``,
         the validation success should have no ``ProxyGrantingTicket``.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url,
-                                                              'ticket': self.pt.ticket,
-                                                              'pgtUrl': self.url})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url,
+                                                        'ticket': self.pt.ticket,
+                                                        'pgtUrl': self.url})
         response = ProxyValidateView.as_view()(request)
         self.assertContains(response, 'authenticationSuccess')
         self.assertNotContains(response, 'proxyGrantingTicket')
@@ -551,37 +586,43 @@ class ProxyValidateViewTests(TestCase):
         When ``MAMA_CAS_VALID_SERVICES`` is defined, a validation
         failure should be returned if the service URL does not match.
         """
-        request = self.rf.get(reverse('cas_proxy_validate'), {'service': self.url, 'ticket': self.pt.ticket})
+        request = self.rf.get(self.proxy_validate_url, {'service': self.url, 'ticket': self.pt.ticket})
         response = ProxyValidateView.as_view()(request)
-        self.assertContains(response, 'INVALID_SERVICE')
+        self.assertContains(response, 'code="INVALID_SERVICE"')
 
 
 class ProxyViewTests(TestCase):
     url = 'http://www.example.com/'
     url2 = 'http://www.example.org/'
 
-    def setUp(self):
-        self.st = ServiceTicketFactory()
-        self.pgt = ProxyGrantingTicketFactory()
-        self.rf = RequestFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(ProxyViewTests, cls).setUpClass()
+        cls.proxy_url = reverse('cas_proxy')
+        cls.rf = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.st = ServiceTicketFactory()
+        cls.pgt = ProxyGrantingTicketFactory(granted_by_st=cls.st)
 
     def test_proxy_view(self):
         """
         When called with no parameters, a validation failure should be
         returned.
         """
-        request = self.rf.get(reverse('cas_proxy'))
+        request = self.rf.get(self.proxy_url)
         response = ProxyView.as_view()(request)
-        self.assertContains(response, 'INVALID_REQUEST')
+        self.assertContains(response, 'code="INVALID_REQUEST"')
 
     def test_proxy_view_no_service(self):
         """
         When called with no service identifier, a validation failure
         should be returned.
         """
-        request = self.rf.get(reverse('cas_proxy'), {'pgt': self.pgt.ticket})
+        request = self.rf.get(self.proxy_url, {'pgt': self.pgt.ticket})
         response = ProxyView.as_view()(request)
-        self.assertContains(response, 'INVALID_REQUEST')
+        self.assertContains(response, 'code="INVALID_REQUEST"')
 
     def test_proxy_view_invalid_ticket(self):
         """
@@ -589,16 +630,16 @@ class ProxyViewTests(TestCase):
         should be returned.
         """
         pgt_str = ProxyTicket.objects.create_ticket_str()
-        request = self.rf.get(reverse('cas_proxy'), {'targetService': self.url, 'pgt': pgt_str})
+        request = self.rf.get(self.proxy_url, {'targetService': self.url, 'pgt': pgt_str})
         response = ProxyView.as_view()(request)
-        self.assertContains(response, 'INVALID_TICKET')
+        self.assertContains(response, 'code="INVALID_TICKET"')
 
     def test_proxy_view_success(self):
         """
         When called with valid parameters, a validation success
         should be returned.
         """
-        request = self.rf.get(reverse('cas_proxy'), {'targetService': self.url, 'pgt': self.pgt.ticket})
+        request = self.rf.get(self.proxy_url, {'targetService': self.url, 'pgt': self.pgt.ticket})
         response = ProxyView.as_view()(request)
         self.assertContains(response, 'proxyTicket')
 
@@ -608,15 +649,20 @@ class ProxyViewTests(TestCase):
         When called with an invalid service identifier, a proxy
         authentication failure should be returned.
         """
-        request = self.rf.get(reverse('cas_proxy'), {'targetService': self.url2, 'pgt': self.pgt.ticket})
+        request = self.rf.get(self.proxy_url, {'targetService': self.url2, 'pgt': self.pgt.ticket})
         response = ProxyView.as_view()(request)
-        self.assertContains(response, 'INVALID_SERVICE')
+        self.assertContains(response, 'code="INVALID_SERVICE"')
 
 
 class SamlValidationViewTests(TestCase):
-    def setUp(self):
-        self.st = ServiceTicketFactory(service='https://www.example.com/')
-        self.rf = RequestFactory()
+    @classmethod
+    def setUpClass(cls):
+        super(SamlValidationViewTests, cls).setUpClass()
+        cls.rf = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.st = ServiceTicketFactory(service='https://www.example.com/')
 
     def test_saml_validation_view(self):
         """
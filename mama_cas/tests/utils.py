@@ -6,15 +6,17 @@ from mama_cas.compat import etree
 from mama_cas.compat import urlencode
 
 
+NS_RE = re.compile(r'^{.*?}')
+
+
 def parse(s):
     """
     Parse an XML tree from the given string, removing all
     of the included namespace strings.
     """
-    ns = re.compile(r'^{.*?}')
     et = etree.fromstring(s)
-    for elem in et.getiterator():
-        elem.tag = ns.sub('', elem.tag)
+    for elem in et.iter():
+        elem.tag = NS_RE.sub('', elem.tag)
     return et
 
 